@@ -5,9 +5,10 @@ Tests the server's ability to accurately answer questions about the resume
 """
 
 import json
+import sys
 import time
 from typing import Dict, List, Tuple, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 
 
@@ -18,6 +19,10 @@ class TestCase:
     expected_keywords: List[str]
     category: str
     min_score: float = 0.7
+    _keywords_lower: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._keywords_lower = tuple(k.lower() for k in self.expected_keywords)
 
 
 class ResumeServerEvaluator:
@@ -128,11 +133,10 @@ class ResumeServerEvaluator:
     def calculate_score(self, response: str, test_case: TestCase) -> Tuple[float, List[str]]:
         """Calculate the score for a response based on expected keywords"""
         response_lower = response.lower()
-        found_keywords = []
-
-        for keyword in test_case.expected_keywords:
-            if keyword.lower() in response_lower:
-                found_keywords.append(keyword)
+        found_keywords = [
+            keyword for keyword, keyword_lower in zip(test_case.expected_keywords, test_case._keywords_lower)
+            if keyword_lower in response_lower
+        ]
 
         score = len(found_keywords) / len(test_case.expected_keywords) if test_case.expected_keywords else 0
         return score, found_keywords
@@ -161,15 +165,17 @@ class ResumeServerEvaluator:
 
         results = []
         category_scores = {}
+        # Per-test output is collected and written once after the loop
+        lines: List[str] = []
 
         for i, test_case in enumerate(self.test_cases, 1):
-            print(f"\n[{i}/{len(self.test_cases)}] Testing: {test_case.query}")
+            lines.append(f"\n[{i}/{len(self.test_cases)}] Testing: {test_case.query}")
 
             # Measure response time
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
             try:
                 response = server_func(test_case.query)
-                response_time_ms = int((time.time() - start_time) * 1000)
+                response_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
 
                 # Evaluate the response
                 result = self.evaluate_response(test_case, response, response_time_ms)
@@ -182,13 +188,13 @@ class ResumeServerEvaluator:
 
                 # Print result
                 status = "✅ PASS" if result["passed"] else "❌ FAIL"
-                print(f"  {status} - Score: {result['score']:.0%} (Required: {test_case.min_score:.0%})")
-                print(f"  Found: {', '.join(result['found_keywords'][:3])}...")
+                lines.append(f"  {status} - Score: {result['score']:.0%} (Required: {test_case.min_score:.0%})")
+                lines.append(f"  Found: {', '.join(result['found_keywords'][:3])}...")
                 if result["missing_keywords"]:
-                    print(f"  Missing: {', '.join(result['missing_keywords'][:3])}...")
+                    lines.append(f"  Missing: {', '.join(result['missing_keywords'][:3])}...")
 
             except Exception as e:
-                print(f"  ❌ ERROR: {str(e)}")
+                lines.append(f"  ❌ ERROR: {str(e)}")
                 results.append({
                     "query": test_case.query,
                     "error": str(e),
@@ -196,6 +202,8 @@ class ResumeServerEvaluator:
                     "score": 0
                 })
 
+        sys.stdout.write("\n".join(lines) + "\n")
+
         # Calculate summary statistics
         total_passed = sum(1 for r in results if r.get("passed", False))
         total_tests = len(results)
@@ -4,13 +4,14 @@ Quick Start Demo for Rishi's Resume Server
 Run this to see example interactions with the resume
 """
 
-import json
+import sys
 import time
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
 # Load resume data
-with open("resume_data.json", "r") as f:
-    resume_data = json.load(f)
+from resume_loader import RESUME_DATA as resume_data
 
 def print_section(title):
     """Print a formatted section header"""
@@ -21,44 +22,50 @@ def print_section(title):
 def simulate_query(question, response_generator):
     """Simulate a query with timing"""
     print(f"❓ Question: {question}")
-    start = time.time()
+    start = time.perf_counter_ns()
     response = response_generator()
-    elapsed = (time.time() - start) * 1000
+    elapsed_ms = (time.perf_counter_ns() - start) // 1_000_000
     print(f"💬 Response: {response}")
-    print(f"⏱️  Response time: {elapsed:.0f}ms\n")
+    print(f"⏱️  Response time: {elapsed_ms}ms\n")
     return response
 
 def demo_ai_experience():
     """Demo AI/ML experience queries"""
     print_section("🤖 AI/ML EXPERIENCE")
+    ai_experience = resume_data['ai_experience']
+    first_model = ai_experience['models_built'][0]
+    tools_used = ai_experience['tools_used']
+    initiatives = ai_experience['initiatives_led'][:2]
 
     # Query 1: AI Models
     simulate_query(
         "What AI models has Rishi built?",
-        lambda: f"Rishi built an ML-powered underwriting model at Justworks achieving {resume_data['ai_experience']['models_built'][0]}. "
-                f"He's also championed AI adoption using tools like {', '.join(resume_data['ai_experience']['tools_used'])}."
+        lambda: f"Rishi built an ML-powered underwriting model at Justworks achieving {first_model}. "
+                f"He's also championed AI adoption using tools like {', '.join(tools_used)}."
     )
 
     # Query 2: AI Leadership
     simulate_query(
         "How has Rishi championed AI adoption?",
-        lambda: "Rishi has led AI adoption through: " + ", ".join(resume_data['ai_experience']['initiatives_led'][:2])
+        lambda: "Rishi has led AI adoption through: " + ", ".join(initiatives)
     )
 
 def demo_business_impact():
     """Demo business impact queries"""
     print_section("💰 BUSINESS IMPACT")
+    revenue_impact = resume_data['key_metrics']['revenue_impact']
+    efficiency_gains = resume_data['key_metrics']['efficiency_gains'][:3]
 
     # Revenue Impact
     simulate_query(
         "What revenue has Rishi generated?",
-        lambda: f"Key revenue impacts: {', '.join(resume_data['key_metrics']['revenue_impact'])}"
+        lambda: f"Key revenue impacts: {', '.join(revenue_impact)}"
     )
 
     # Efficiency Gains
     simulate_query(
         "What efficiency improvements has Rishi delivered?",
-        lambda: f"Major efficiency gains: {', '.join(resume_data['key_metrics']['efficiency_gains'][:3])}"
+        lambda: f"Major efficiency gains: {', '.join(efficiency_gains)}"
     )
 
 def demo_experience_search():
@@ -69,19 +76,21 @@ def demo_experience_search():
     company = "Justworks"
     exp = next((e for e in resume_data['experience'] if company in e['company']), None)
     if exp:
+        key_achievement = exp['achievements'][0]['description'] if exp['achievements'] else 'Multiple achievements'
         simulate_query(
             f"Tell me about Rishi's role at {company}",
             lambda: f"{exp['title']} at {exp['company']} ({exp['duration']}). "
-                    f"Key achievement: {exp['achievements'][0]['description'] if exp['achievements'] else 'Multiple achievements'}"
+                    f"Key achievement: {key_achievement}"
         )
 
 def demo_fit_for_role():
     """Demo fit for AI PM role"""
     print_section("🎯 FIT FOR AI PM ROLE")
+    top_reasons = resume_data['unique_value_props']['for_ai_pm_role'][:3]
 
     simulate_query(
         "Why is Rishi a great fit for an AI PM role?",
-        lambda: "Top reasons: " + " | ".join(resume_data['unique_value_props']['for_ai_pm_role'][:3])
+        lambda: "Top reasons: " + " | ".join(top_reasons)
     )
 
 def show_analytics():
@@ -4,34 +4,63 @@ Rishi's Resume MCP Server
 Interactive resume server for AI PM role demonstration
 """
 
-import json
-import re
+import sys
+import time
+from collections import Counter, deque
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
 from mcp.server.fastmcp import FastMCP
 
+# Shared modules live in src/
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+# Load resume data (parsed once per process)
+from resume_loader import RESUME_DATA
+
 # Initialize MCP server
 mcp = FastMCP("Rishi's Resume Server")
 
-# Load resume data
-RESUME_DATA_PATH = Path(__file__).parent / "resume_data.json"
-with open(RESUME_DATA_PATH, "r") as f:
-    RESUME_DATA = json.load(f)
 
+# === SEARCH DATA ===
 
-# === RESOURCES ===
+def _flatten_achievements():
+    """Achievements in resume order with their experience index, plus every tag and its achievement"""
+    achievements, exp_indexes, tags_lower, tag_positions = [], [], [], []
+    for exp_index, exp in enumerate(RESUME_DATA["experience"]):
+        for achievement in exp.get("achievements", []):
+            for tag in achievement.get("tags", []):
+                tags_lower.append(tag.lower())
+                tag_positions.append(len(achievements))
+            achievements.append((exp, achievement))
+            exp_indexes.append(exp_index)
+    return achievements, exp_indexes, tags_lower, tag_positions
 
-@mcp.resource("resume://summary")
-def get_summary() -> str:
-    """Get professional summary"""
-    return RESUME_DATA["summary"]
 
+_ACHIEVEMENTS, _ACH_EXP_INDEX, _TAG_LOWER, _TAG_ACH_POSITION = _flatten_achievements()
+_ACH_DESC_LOWER = [achievement["description"].lower() for _, achievement in _ACHIEVEMENTS]
 
-@mcp.resource("resume://experience")
-def get_experience() -> str:
-    """Get complete work experience"""
+# Lowercased company and title of each experience, parallel to RESUME_DATA["experience"]
+_COMPANY_LOWER = [exp["company"].lower() for exp in RESUME_DATA["experience"]]
+_TITLE_LOWER = [exp["title"].lower() for exp in RESUME_DATA["experience"]]
+
+# Skills flattened as (category, skill) in resume order
+_SKILLS = [
+    (category, skill)
+    for category, skills_list in RESUME_DATA.get("skills", {}).items()
+    for skill in skills_list
+]
+_SKILL_LOWER = [skill.lower() for _, skill in _SKILLS]
+
+
+# === RESOURCES ===
+
+# RESUME_DATA does not change while the server runs, so resource text is built once
+
+def _build_experience_text() -> str:
+    """Render the complete work experience"""
     experiences = []
     for exp in RESUME_DATA["experience"]:
         exp_text = f"**{exp['title']}** at {exp['company']} ({exp['duration']})\n"
@@ -46,32 +75,71 @@ def get_experience() -> str:
     return "\n\n".join(experiences)
 
 
+def _build_education_text() -> str:
+    """Render the education background"""
+    edu_list = []
+    for edu in RESUME_DATA["education"]:
+        edu_list.append(f"• {edu['degree']} - {edu['institution']} ({edu['years']})")
+    return "**Education:**\n" + "\n".join(edu_list)
+
+
+def _build_contact_text() -> str:
+    """Render the contact information"""
+    personal = RESUME_DATA["personal"]
+    return f"""**Contact Information:**
+Name: {personal['name']}
+LinkedIn: {personal['linkedin']}
+Website: {personal.get('website', '')}"""
+
+
+def _build_skills_texts() -> Dict[str, str]:
+    """Render the skills of every category"""
+    return {
+        category: f"**{category.replace('_', ' ').title()} Skills:**\n" + "\n".join(f"• {skill}" for skill in skills_list)
+        for category, skills_list in RESUME_DATA.get("skills", {}).items()
+    }
+
+
+# Resources return these same str objects on every request (FastMCP would send
+# bytes as a binary blob, so text resources stay str)
+_EXPERIENCE_TEXT = _build_experience_text()
+_EDUCATION_TEXT = _build_education_text()
+_CONTACT_TEXT = _build_contact_text()
+_SKILLS_TEXTS = _build_skills_texts()
+_SKILL_CATEGORIES_TEXT = ", ".join(RESUME_DATA.get("skills", {}).keys())
+
+
+@mcp.resource("resume://summary")
+def get_summary() -> str:
+    """Get professional summary"""
+    return RESUME_DATA["summary"]
+
+
+@mcp.resource("resume://experience")
+def get_experience() -> str:
+    """Get complete work experience"""
+    return _EXPERIENCE_TEXT
+
+
 @mcp.resource("resume://skills/{category}")
 def get_skills(category: str) -> str:
     """Get skills by category (product_strategy, ai_ml, technical, domain, analytics, leadership)"""
-    skills = RESUME_DATA.get("skills", {})
-    if category in skills:
-        return f"**{category.replace('_', ' ').title()} Skills:**\n" + "\n".join(f"• {skill}" for skill in skills[category])
-    return f"No skills found for category: {category}. Available categories: {', '.join(skills.keys())}"
+    text = _SKILLS_TEXTS.get(category)
+    if text is None:
+        return f"No skills found for category: {category}. Available categories: {_SKILL_CATEGORIES_TEXT}"
+    return text
 
 
 @mcp.resource("resume://education")
 def get_education() -> str:
     """Get education background"""
-    edu_list = []
-    for edu in RESUME_DATA["education"]:
-        edu_list.append(f"• {edu['degree']} - {edu['institution']} ({edu['years']})")
-    return "**Education:**\n" + "\n".join(edu_list)
+    return _EDUCATION_TEXT
 
 
 @mcp.resource("resume://contact")
 def get_contact() -> str:
     """Get contact information"""
-    personal = RESUME_DATA["personal"]
-    return f"""**Contact Information:**
-Name: {personal['name']}
-LinkedIn: {personal['linkedin']}
-Website: {personal.get('website', '')}"""
+    return _CONTACT_TEXT
 
 
 # === TOOLS ===
@@ -82,10 +150,16 @@ def search_experience(query: str) -> Dict[str, Any]:
     query_lower = query.lower()
     matches = []
 
-    for exp in RESUME_DATA["experience"]:
+    # Matching achievements grouped by experience, so results keep resume order
+    achievement_hits: Dict[int, List[int]] = {}
+    positions = [i for i, t in enumerate(_ACH_DESC_LOWER) if query_lower in t]
+    for position in positions:
+        achievement_hits.setdefault(_ACH_EXP_INDEX[position], []).append(position)
+
+    for exp_index, exp in enumerate(RESUME_DATA["experience"]):
         # Check company, title, and achievements
-        if (query_lower in exp["company"].lower() or
-            query_lower in exp["title"].lower()):
+        if (query_lower in _COMPANY_LOWER[exp_index] or
+            query_lower in _TITLE_LOWER[exp_index]):
             matches.append({
                 "company": exp["company"],
                 "title": exp["title"],
@@ -93,15 +167,15 @@ def search_experience(query: str) -> Dict[str, Any]:
                 "match_type": "role"
             })
 
-        for achievement in exp.get("achievements", []):
-            if query_lower in achievement["description"].lower():
-                matches.append({
-                    "company": exp["company"],
-                    "title": exp["title"],
-                    "achievement": achievement["description"],
-                    "metrics": achievement.get("metrics", []),
-                    "match_type": "achievement"
-                })
+        for position in achievement_hits.get(exp_index, ()):
+            _, achievement = _ACHIEVEMENTS[position]
+            matches.append({
+                "company": exp["company"],
+                "title": exp["title"],
+                "achievement": achievement["description"],
+                "metrics": achievement.get("metrics", []),
+                "match_type": "achievement"
+            })
 
     return {
         "query": query,
@@ -110,22 +184,25 @@ def search_experience(query: str) -> Dict[str, Any]:
     }
 
 
-@mcp.tool()
-def get_ai_ml_experience() -> Dict[str, Any]:
-    """Get all AI/ML related experience and projects"""
+# Achievement tags that mark AI/ML work
+_AI_TAG_SET = frozenset({"AI/ML", "AI", "automation", "ML"})
+
+
+def _build_ai_ml_experience() -> Dict[str, Any]:
+    """Collect AI/ML experience and the achievements tagged as AI/ML"""
     ai_experience = RESUME_DATA.get("ai_experience", {})
 
     # Also search for AI/ML in achievements
-    ai_achievements = []
-    for exp in RESUME_DATA["experience"]:
-        for achievement in exp.get("achievements", []):
-            if any(tag in ["AI/ML", "AI", "automation", "ML"] for tag in achievement.get("tags", [])):
-                ai_achievements.append({
-                    "company": exp["company"],
-                    "role": exp["title"],
-                    "achievement": achievement["description"],
-                    "metrics": achievement.get("metrics", [])
-                })
+    ai_achievements = [
+        {
+            "company": exp["company"],
+            "role": exp["title"],
+            "achievement": achievement["description"],
+            "metrics": achievement.get("metrics", [])
+        }
+        for exp, achievement in _ACHIEVEMENTS
+        if not _AI_TAG_SET.isdisjoint(achievement.get("tags", []))
+    ]
 
     return {
         "models_built": ai_experience.get("models_built", []),
@@ -136,6 +213,16 @@ def get_ai_ml_experience() -> Dict[str, Any]:
     }
 
 
+# Built once; the response only depends on RESUME_DATA
+_AI_ML_EXPERIENCE = _build_ai_ml_experience()
+
+
+@mcp.tool()
+def get_ai_ml_experience() -> Dict[str, Any]:
+    """Get all AI/ML related experience and projects"""
+    return _AI_ML_EXPERIENCE
+
+
 @mcp.tool()
 def get_metrics_and_impact() -> Dict[str, Any]:
     """Get quantifiable metrics and business impact"""
@@ -149,25 +236,24 @@ def search_by_skill(skill: str) -> Dict[str, Any]:
     matches = []
 
     # Search in skills
-    for category, skills_list in RESUME_DATA.get("skills", {}).items():
-        for s in skills_list:
-            if skill_lower in s.lower():
-                matches.append({
-                    "type": "skill",
-                    "category": category,
-                    "skill": s
-                })
-
-    # Search in experience tags
-    for exp in RESUME_DATA["experience"]:
-        for achievement in exp.get("achievements", []):
-            if any(skill_lower in tag.lower() for tag in achievement.get("tags", [])):
-                matches.append({
-                    "type": "experience",
-                    "company": exp["company"],
-                    "achievement": achievement["description"],
-                    "tags": achievement.get("tags", [])
-                })
+    for position in [i for i, t in enumerate(_SKILL_LOWER) if skill_lower in t]:
+        category, s = _SKILLS[position]
+        matches.append({
+            "type": "skill",
+            "category": category,
+            "skill": s
+        })
+
+    # Search in experience tags (each achievement is reported once)
+    tag_positions = [i for i, t in enumerate(_TAG_LOWER) if skill_lower in t]
+    for position in sorted({_TAG_ACH_POSITION[p] for p in tag_positions}):
+        exp, achievement = _ACHIEVEMENTS[position]
+        matches.append({
+            "type": "experience",
+            "company": exp["company"],
+            "achievement": achievement["description"],
+            "tags": achievement.get("tags", [])
+        })
 
     return {
         "query": skill,
@@ -176,13 +262,11 @@ def search_by_skill(skill: str) -> Dict[str, Any]:
     }
 
 
-@mcp.tool()
-def get_company_details(company: str) -> Dict[str, Any]:
-    """Get detailed information about experience at a specific company"""
-    company_lower = company.lower()
-
-    for exp in RESUME_DATA["experience"]:
-        if company_lower in exp["company"].lower():
+@lru_cache(maxsize=32)
+def _company_details(company_lower: str) -> Optional[Dict[str, Any]]:
+    """Details of the first experience whose company contains company_lower"""
+    for exp, exp_company_lower in zip(RESUME_DATA["experience"], _COMPANY_LOWER):
+        if company_lower in exp_company_lower:
             return {
                 "company": exp["company"],
                 "title": exp["title"],
@@ -191,41 +275,61 @@ def get_company_details(company: str) -> Dict[str, Any]:
                 "achievements": exp.get("achievements", []),
                 "total_achievements": len(exp.get("achievements", []))
             }
-
-    return {"error": f"No experience found at company: {company}"}
+    return None
 
 
 @mcp.tool()
-def calculate_total_experience() -> Dict[str, Any]:
-    """Calculate total years of experience and career progression"""
-    experiences = RESUME_DATA["experience"]
+def get_company_details(company: str) -> Dict[str, Any]:
+    """Get detailed information about experience at a specific company"""
+    details = _company_details(company.lower())
+    if details is None:
+        return {"error": f"No experience found at company: {company}"}
+    return details
 
-    # Parse dates from first and last experience
-    if experiences:
-        latest = experiences[0]["duration"]
-        earliest = experiences[-1]["duration"]
 
+def _experience_span() -> Optional[Dict[str, Any]]:
+    """Parse the year span of the experience list"""
+    experiences = RESUME_DATA["experience"]
+    if not experiences:
+        return None
+    latest = experiences[0]["duration"]
+    earliest = experiences[-1]["duration"]
+    return {
         # Extract start year from earliest
-        earliest_year = int(earliest.split("/")[-1].split(" ")[0])
-
-        # Check if still current role
-        if "present" in latest.lower():
-            current_year = datetime.now().year
-            total_years = current_year - earliest_year
-        else:
-            latest_year = int(latest.split(" - ")[1].split("/")[-1])
-            total_years = latest_year - earliest_year
-
-        return {
-            "total_years": total_years,
-            "companies_worked": len([exp for exp in experiences if exp["company"] != "Beander"]),
-            "roles_held": len(experiences),
-            "current_role": experiences[0]["title"],
-            "current_company": experiences[0]["company"],
-            "career_progression": [{"title": exp["title"], "company": exp["company"]} for exp in experiences]
-        }
+        "earliest_year": int(earliest.split("/")[-1].split(" ")[0]),
+        # None while the latest role is current
+        "latest_year": None if "present" in latest.lower() else int(latest.split(" - ")[1].split("/")[-1]),
+    }
+
+
+_EXPERIENCE_SPAN = _experience_span()
+_ROLES_HELD = len(RESUME_DATA["experience"])
+_COMPANIES_WORKED = sum(1 for exp in RESUME_DATA["experience"] if exp["company"] != "Beander")
+_CAREER_PROGRESSION = [{"title": exp["title"], "company": exp["company"]} for exp in RESUME_DATA["experience"]]
+
 
-    return {"error": "Unable to calculate experience"}
+@lru_cache(maxsize=1)
+def _total_experience(current_year: int) -> Dict[str, Any]:
+    """Build the experience summary as of the given year"""
+    if _EXPERIENCE_SPAN is None:
+        return {"error": "Unable to calculate experience"}
+    latest_year = _EXPERIENCE_SPAN["latest_year"]
+    total_years = (current_year if latest_year is None else latest_year) - _EXPERIENCE_SPAN["earliest_year"]
+    current = RESUME_DATA["experience"][0]
+    return {
+        "total_years": total_years,
+        "companies_worked": _COMPANIES_WORKED,
+        "roles_held": _ROLES_HELD,
+        "current_role": current["title"],
+        "current_company": current["company"],
+        "career_progression": _CAREER_PROGRESSION
+    }
+
+
+@mcp.tool()
+def calculate_total_experience() -> Dict[str, Any]:
+    """Calculate total years of experience and career progression"""
+    return _total_experience(datetime.now().year)
 
 
 # === PROMPTS ===
@@ -286,22 +390,58 @@ Each point should:
 
 # === ANALYTICS ===
 
-# Track queries for analytics (in production, this would be stored in a database)
-query_log = []
+# Track queries for analytics (in production, this would be stored in a database).
+# Only the most recent entries are kept, as (timestamp_ns, topic, response_time_ms)
+# tuples; the summary is served from running totals updated on every log
+query_log = deque(maxlen=10000)
+_topic_counts = Counter()
+_query_count = 0
+_response_time_sum = 0
+_response_time_count = 0
+_first_query_ns = None
+
+# Analytics topics in priority order, each with the query terms (matched as substrings) that count towards it
+_QUERY_TOPICS = (
+    ("ai_ml", ("ai", "ml", "machine learning", "model")),
+    ("experience", ("experience", "work", "role", "company")),
+    ("skills", ("skill",)),
+    ("metrics", ("metric", "impact", "revenue", "number")),
+    ("contact", ("contact",)),
+)
+
+
+def _format_timestamp(timestamp_ns: int) -> str:
+    """Local-time ISO 8601 string for a time.time_ns() timestamp"""
+    seconds, nanoseconds = divmod(timestamp_ns, 1_000_000_000)
+    return datetime.fromtimestamp(seconds).replace(microsecond=nanoseconds // 1000).isoformat()
+
+
+def _categorize_query(query: str) -> str:
+    """Analytics topic of a query, or "other" when it matches none"""
+    query_lower = query.lower()
+    return next((topic for topic, terms in _QUERY_TOPICS if any(term in query_lower for term in terms)), "other")
 
 @mcp.tool()
 def log_query(query: str, response_time_ms: Optional[int] = None) -> Dict[str, Any]:
     """Log a query for analytics purposes"""
-    query_entry = {
-        "timestamp": datetime.now().isoformat(),
-        "query": query,
-        "response_time_ms": response_time_ms
-    }
-    query_log.append(query_entry)
+    global _query_count, _response_time_sum, _response_time_count, _first_query_ns
+
+    # Raw epoch nanoseconds; ISO formatting is deferred to get_analytics_summary
+    timestamp_ns = time.time_ns()
+    topic = _categorize_query(query)
+    query_log.append((timestamp_ns, topic, response_time_ms))
+
+    _query_count += 1
+    _topic_counts[topic] += 1
+    if response_time_ms:
+        _response_time_sum += response_time_ms
+        _response_time_count += 1
+    if _first_query_ns is None:
+        _first_query_ns = timestamp_ns
 
     return {
         "logged": True,
-        "total_queries": len(query_log),
+        "total_queries": _query_count,
         "message": "Query logged for analytics"
     }
 
@@ -309,44 +449,21 @@ def log_query(query: str, response_time_ms: Optional[int] = None) -> Dict[str, A
 @mcp.tool()
 def get_analytics_summary() -> Dict[str, Any]:
     """Get analytics summary of queries made to the resume server"""
-    if not query_log:
+    if not _query_count:
         return {"message": "No queries logged yet"}
 
     # Analyze query patterns
-    query_topics = {
-        "ai_ml": 0,
-        "experience": 0,
-        "skills": 0,
-        "metrics": 0,
-        "contact": 0,
-        "other": 0
-    }
-
-    for entry in query_log:
-        query_lower = entry["query"].lower()
-        if any(term in query_lower for term in ["ai", "ml", "machine learning", "model"]):
-            query_topics["ai_ml"] += 1
-        elif any(term in query_lower for term in ["experience", "work", "role", "company"]):
-            query_topics["experience"] += 1
-        elif "skill" in query_lower:
-            query_topics["skills"] += 1
-        elif any(term in query_lower for term in ["metric", "impact", "revenue", "number"]):
-            query_topics["metrics"] += 1
-        elif "contact" in query_lower:
-            query_topics["contact"] += 1
-        else:
-            query_topics["other"] += 1
+    query_topics = {topic: _topic_counts[topic] for topic in (*(topic for topic, _ in _QUERY_TOPICS), "other")}
 
     # Calculate average response time
-    response_times = [q["response_time_ms"] for q in query_log if q.get("response_time_ms")]
-    avg_response_time = sum(response_times) / len(response_times) if response_times else 0
+    avg_response_time = _response_time_sum / _response_time_count if _response_time_count else 0
 
     return {
-        "total_queries": len(query_log),
+        "total_queries": _query_count,
         "query_topics": query_topics,
         "average_response_time_ms": avg_response_time,
-        "first_query": query_log[0]["timestamp"] if query_log else None,
-        "last_query": query_log[-1]["timestamp"] if query_log else None
+        "first_query": _format_timestamp(_first_query_ns),
+        "last_query": _format_timestamp(query_log[-1][0])
     }
 
 
@@ -4,10 +4,25 @@ Compact Answer Formatter with Citations
 Implements the build plan's compact bullet format with line-level citations
 """
 
-import json
 from typing import Dict, List, Tuple, Any, Optional
-from pathlib import Path
 import re
+from bisect import bisect_right
+from itertools import accumulate
+
+from resume_loader import RESUME_DATA, load_resume_data
+
+
+# Formatter method for each group of question keywords (matched as substrings);
+# when a question mentions several groups, the first one here wins
+_TOPIC_FORMATTERS = (
+    (("ai", "ml"), "_format_ai_ml_answer"),
+    (("revenue", "impact"), "_format_impact_answer"),
+    (("experience", "companies"), "_format_experience_answer"),
+    (("skill",), "_format_skills_answer"),
+)
+
+# An inline citation such as "[experience_justworks]"
+_CITATION_RE = re.compile(r'\[[\w_]+\]')
 
 
 class AnswerFormatter:
@@ -15,13 +30,10 @@ class AnswerFormatter:
 
     def __init__(self, resume_data_path: str = None):
         if resume_data_path:
-            with open(resume_data_path, "r") as f:
-                self.resume_data = json.load(f)
+            self.resume_data = load_resume_data(resume_data_path)
         else:
-            # Default path
-            path = Path(__file__).parent.parent / "resume_data.json"
-            with open(path, "r") as f:
-                self.resume_data = json.load(f)
+            # Default resume, already parsed once for the whole process
+            self.resume_data = RESUME_DATA
 
     def format_compact_answer(
         self,
@@ -47,8 +59,6 @@ class AnswerFormatter:
             }
         }
         """
-        bullets = []
-        citations = []
         section_map = {}
 
         # Determine if we have evidence
@@ -66,33 +76,26 @@ class AnswerFormatter:
             }
 
         # Extract key information based on question type
-        if "ai" in question.lower() or "ml" in question.lower():
-            bullets, citations = self._format_ai_ml_answer(retrieved_data)
-        elif "revenue" in question.lower() or "impact" in question.lower():
-            bullets, citations = self._format_impact_answer(retrieved_data)
-        elif "experience" in question.lower() or "companies" in question.lower():
-            bullets, citations = self._format_experience_answer(retrieved_data)
-        elif "skill" in question.lower():
-            bullets, citations = self._format_skills_answer(retrieved_data)
-        else:
-            bullets, citations = self._format_general_answer(retrieved_data)
+        question_lower = question.lower()
+        formatter = next(
+            (name for keywords, name in _TOPIC_FORMATTERS if any(k in question_lower for k in keywords)),
+            "_format_general_answer"
+        )
+        entries = getattr(self, formatter)(retrieved_data)
 
         # Limit bullets and characters
-        bullets = bullets[:max_bullets]
-        text = "\n".join(bullets)
+        entries = entries[:max_bullets]
+        text = "\n".join(bullet for _, _, bullet in entries)
 
         if len(text) > max_chars:
-            # Truncate to max_chars while keeping complete bullets
-            truncated_bullets = []
-            char_count = 0
-            for bullet in bullets:
-                if char_count + len(bullet) + 1 <= max_chars:
-                    truncated_bullets.append(bullet)
-                    char_count += len(bullet) + 1
-                else:
-                    break
-            bullets = truncated_bullets
-            text = "\n".join(bullets)
+            # Truncate to max_chars while keeping complete bullets: keep the longest
+            # prefix whose running length (each bullet plus a newline) fits
+            running_lengths = list(accumulate(len(bullet) + 1 for _, _, bullet in entries))
+            entries = entries[:bisect_right(running_lengths, max_chars)]
+            text = "\n".join(bullet for _, _, bullet in entries)
+
+        bullets = [bullet for _, _, bullet in entries]
+        citations = [{"section_id": section_id, "content": content} for section_id, content, _ in entries]
 
         return {
             "text": text,
@@ -104,65 +107,52 @@ class AnswerFormatter:
             }
         }
 
-    def _format_ai_ml_answer(self, data: Dict) -> Tuple[List[str], List[Dict]]:
+    # Each _format_* method returns (section_id, content, bullet) entries, one per bullet
+
+    def _format_ai_ml_answer(self, data: Dict) -> List[Tuple[str, str, str]]:
         """Format AI/ML specific answers"""
-        bullets = []
-        citations = []
+        entries = []
 
         # From AI experience
         if "models_built" in data:
-            for model in data["models_built"]:
-                bullets.append(f"• Built {model} [experience_justworks]")
-                citations.append({
-                    "section_id": "experience_justworks",
-                    "content": model
-                })
+            entries.extend(
+                ("experience_justworks", model, f"• Built {model} [experience_justworks]")
+                for model in data["models_built"]
+            )
 
         if "tools_used" in data:
             tools = ", ".join(data["tools_used"])
-            bullets.append(f"• Uses {tools} for AI development [skills_ai_ml]")
-            citations.append({
-                "section_id": "skills_ai_ml",
-                "content": tools
-            })
+            entries.append(("skills_ai_ml", tools, f"• Uses {tools} for AI development [skills_ai_ml]"))
 
         if "initiatives_led" in data:
-            for initiative in data["initiatives_led"][:2]:
-                bullets.append(f"• {initiative} [experience_justworks]")
-                citations.append({
-                    "section_id": "experience_justworks",
-                    "content": initiative
-                })
+            entries.extend(
+                ("experience_justworks", initiative, f"• {initiative} [experience_justworks]")
+                for initiative in data["initiatives_led"][:2]
+            )
 
-        return bullets, citations
+        return entries
 
-    def _format_impact_answer(self, data: Dict) -> Tuple[List[str], List[Dict]]:
+    def _format_impact_answer(self, data: Dict) -> List[Tuple[str, str, str]]:
         """Format business impact answers"""
-        bullets = []
-        citations = []
+        entries = []
 
         if "revenue_impact" in data:
-            for impact in data["revenue_impact"][:3]:
-                bullets.append(f"• Generated {impact} [key_metrics]")
-                citations.append({
-                    "section_id": "key_metrics",
-                    "content": impact
-                })
+            entries.extend(
+                ("key_metrics", impact, f"• Generated {impact} [key_metrics]")
+                for impact in data["revenue_impact"][:3]
+            )
 
         if "efficiency_gains" in data:
-            for gain in data["efficiency_gains"][:2]:
-                bullets.append(f"• Achieved {gain} [key_metrics]")
-                citations.append({
-                    "section_id": "key_metrics",
-                    "content": gain
-                })
+            entries.extend(
+                ("key_metrics", gain, f"• Achieved {gain} [key_metrics]")
+                for gain in data["efficiency_gains"][:2]
+            )
 
-        return bullets, citations
+        return entries
 
-    def _format_experience_answer(self, data: Dict) -> Tuple[List[str], List[Dict]]:
+    def _format_experience_answer(self, data: Dict) -> List[Tuple[str, str, str]]:
         """Format experience-based answers"""
-        bullets = []
-        citations = []
+        entries = []
 
         if "matches" in data:
             for match in data["matches"][:4]:
@@ -170,71 +160,44 @@ class AnswerFormatter:
                     company = match["company"]
                     title = match.get("title", "Role")
                     section_id = f"experience_{company.lower().replace(' ', '_')}"
-                    bullets.append(f"• {title} at {company} [{ section_id}]")
-                    citations.append({
-                        "section_id": section_id,
-                        "content": f"{title} at {company}"
-                    })
+                    entries.append((section_id, f"{title} at {company}", f"• {title} at {company} [{ section_id}]"))
 
                 if "achievement" in match:
                     achievement = match["achievement"][:80] + "..." if len(match["achievement"]) > 80 else match["achievement"]
-                    bullets.append(f"• {achievement} [{section_id}]")
-                    citations.append({
-                        "section_id": section_id,
-                        "content": achievement
-                    })
+                    entries.append((section_id, achievement, f"• {achievement} [{section_id}]"))
 
-        return bullets, citations
+        return entries
 
-    def _format_skills_answer(self, data: Dict) -> Tuple[List[str], List[Dict]]:
+    def _format_skills_answer(self, data: Dict) -> List[Tuple[str, str, str]]:
         """Format skills-based answers"""
-        bullets = []
-        citations = []
+        entries = []
 
         if "matches" in data:
-            for match in data["matches"][:4]:
-                if match.get("type") == "skill":
-                    category = match["category"]
-                    skill = match["skill"]
-                    section_id = f"skills_{category}"
-                    bullets.append(f"• {skill} [{section_id}]")
-                    citations.append({
-                        "section_id": section_id,
-                        "content": skill
-                    })
-
-        return bullets, citations
-
-    def _format_general_answer(self, data: Dict) -> Tuple[List[str], List[Dict]]:
+            entries.extend(
+                (f"skills_{match['category']}", match["skill"], f"• {match['skill']} [skills_{match['category']}]")
+                for match in data["matches"][:4]
+                if match.get("type") == "skill"
+            )
+
+        return entries
+
+    def _format_general_answer(self, data: Dict) -> List[Tuple[str, str, str]]:
         """Format general answers from any data structure"""
-        bullets = []
-        citations = []
+        entries = []
 
         # Extract whatever information is available
         if isinstance(data, dict):
             for key, value in list(data.items())[:4]:
                 if isinstance(value, list) and value:
                     item = str(value[0])[:100]
-                    bullets.append(f"• {item} [resume]")
-                    citations.append({
-                        "section_id": "resume",
-                        "content": item
-                    })
+                    entries.append(("resume", item, f"• {item} [resume]"))
                 elif isinstance(value, str):
-                    bullets.append(f"• {value[:100]} [resume]")
-                    citations.append({
-                        "section_id": "resume",
-                        "content": value[:100]
-                    })
+                    entries.append(("resume", value[:100], f"• {value[:100]} [resume]"))
 
-        if not bullets:
-            bullets.append("• Information available in resume [resume]")
-            citations.append({
-                "section_id": "resume",
-                "content": "See full resume for details"
-            })
+        if not entries:
+            entries.append(("resume", "See full resume for details", "• Information available in resume [resume]"))
 
-        return bullets, citations
+        return entries
 
     def add_inline_citations(self, text: str, section_ids: List[str]) -> str:
         """Add inline citations to text"""
@@ -242,7 +205,7 @@ class AnswerFormatter:
             return text
 
         # Add citation at the end if not present
-        if not re.search(r'\[[\w_]+\]', text):
+        if not _CITATION_RE.search(text):
             return f"{text} [{section_ids[0]}]"
         return text
 
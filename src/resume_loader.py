@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+Shared Resume Data Loader
+Parses resume_data.json once per process so every module shares one copy
+"""
+
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, Union
+
+RESUME_DATA_PATH = Path(__file__).parent.parent / "resume_data.json"
+
+# Strings shorter than this (tags, skills, companies, titles) are interned
+INTERN_MAX_LENGTH = 64
+
+
+def _intern_strings(value: Any) -> Any:
+    """Intern the short string leaves of parsed JSON, in place for containers"""
+    if isinstance(value, str):
+        return sys.intern(value) if len(value) < INTERN_MAX_LENGTH else value
+    if isinstance(value, dict):
+        for key, item in value.items():
+            value[key] = _intern_strings(item)
+    elif isinstance(value, list):
+        value[:] = [_intern_strings(item) for item in value]
+    return value
+
+
+def load_resume_data(path: Union[str, Path] = RESUME_DATA_PATH) -> Dict[str, Any]:
+    """Parse a resume JSON file"""
+    return _intern_strings(json.loads(Path(path).read_bytes()))
+
+
+RESUME_DATA = load_resume_data()
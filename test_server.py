@@ -23,6 +23,85 @@ from server import (
     RESUME_DATA
 )
 
+def _show_summary():
+    """Print the professional summary"""
+    print("\n📋 SUMMARY:")
+    print(get_summary())
+
+
+def _show_experience():
+    """Print all work experience"""
+    print("\n💼 EXPERIENCE:")
+    print(get_experience())
+
+
+def _show_ai():
+    """Print AI/ML experience"""
+    print("\n🤖 AI/ML EXPERIENCE:")
+    result = get_ai_ml_experience()
+    print(json.dumps(result, indent=2))
+
+
+def _show_metrics():
+    """Print business impact metrics"""
+    print("\n📊 BUSINESS IMPACT:")
+    result = get_metrics_and_impact()
+    print(json.dumps(result, indent=2))
+
+
+def _show_search(search_term=None):
+    """Search experience, prompting for the term if not given"""
+    if search_term is None:
+        search_term = input("Search for: ").strip()
+    print(f"\n🔍 SEARCHING FOR: {search_term}")
+    result = search_experience(search_term)
+    print(json.dumps(result, indent=2))
+
+
+def _show_skills(category=None):
+    """Print skills by category, prompting for it if not given"""
+    if category is None:
+        category = input("Category (ai_ml/technical/domain/analytics/leadership): ").strip()
+    print(f"\n🎯 SKILLS - {category.upper()}:")
+    print(get_skills(category))
+
+
+def _show_company(company=None):
+    """Print company details, prompting for the name if not given"""
+    if company is None:
+        company = input("Company name: ").strip()
+    print(f"\n🏢 COMPANY DETAILS - {company}:")
+    result = get_company_details(company)
+    print(json.dumps(result, indent=2))
+
+
+def _show_total():
+    """Print total experience"""
+    print("\n⏱️  TOTAL EXPERIENCE:")
+    result = calculate_total_experience()
+    print(json.dumps(result, indent=2))
+
+
+# Whole commands (by keyword or number); numbered commands that need an argument prompt for it
+COMMANDS = {
+    'summary': _show_summary, '1': _show_summary,
+    'experience': _show_experience, '2': _show_experience,
+    'ai': _show_ai, '3': _show_ai,
+    'metrics': _show_metrics, '4': _show_metrics,
+    '5': _show_search,
+    '6': _show_skills,
+    '7': _show_company,
+    'total': _show_total, '8': _show_total,
+}
+
+# Keyword commands followed by their argument, e.g. "search pricing"
+ARG_COMMANDS = {
+    'search': _show_search,
+    'skills': _show_skills,
+    'company': _show_company,
+}
+
+
 def test_interactive():
     """Interactive testing of server functions"""
     print("🚀 Resume MCP Server - Interactive Test Mode")
@@ -47,63 +126,24 @@ def test_interactive():
                 print("Goodbye!")
                 break
 
-            elif query == 'summary' or query == '1':
-                print("\n📋 SUMMARY:")
-                print(get_summary())
-
-            elif query == 'experience' or query == '2':
-                print("\n💼 EXPERIENCE:")
-                print(get_experience())
-
-            elif query == 'ai' or query == '3':
-                print("\n🤖 AI/ML EXPERIENCE:")
-                result = get_ai_ml_experience()
-                print(json.dumps(result, indent=2))
-
-            elif query == 'metrics' or query == '4':
-                print("\n📊 BUSINESS IMPACT:")
-                result = get_metrics_and_impact()
+            handler = COMMANDS.get(query)
+            if handler:
+                handler()
+                continue
+
+            cmd, _, arg = query.partition(' ')
+            handler = ARG_COMMANDS.get(cmd)
+            if handler and arg:
+                handler(arg.strip())
+                continue
+
+            # Try it as a general search
+            print(f"\n🔍 SEARCHING: {query}")
+            result = search_experience(query)
+            if result['results_count'] > 0:
                 print(json.dumps(result, indent=2))
-
-            elif query.startswith('search ') or query == '5':
-                if query == '5':
-                    search_term = input("Search for: ").strip()
-                else:
-                    search_term = query[7:].strip()
-                print(f"\n🔍 SEARCHING FOR: {search_term}")
-                result = search_experience(search_term)
-                print(json.dumps(result, indent=2))
-
-            elif query.startswith('skills ') or query == '6':
-                if query == '6':
-                    category = input("Category (ai_ml/technical/domain/analytics/leadership): ").strip()
-                else:
-                    category = query[7:].strip()
-                print(f"\n🎯 SKILLS - {category.upper()}:")
-                print(get_skills(category))
-
-            elif query.startswith('company ') or query == '7':
-                if query == '7':
-                    company = input("Company name: ").strip()
-                else:
-                    company = query[8:].strip()
-                print(f"\n🏢 COMPANY DETAILS - {company}:")
-                result = get_company_details(company)
-                print(json.dumps(result, indent=2))
-
-            elif query == 'total' or query == '8':
-                print("\n⏱️  TOTAL EXPERIENCE:")
-                result = calculate_total_experience()
-                print(json.dumps(result, indent=2))
-
             else:
-                # Try it as a general search
-                print(f"\n🔍 SEARCHING: {query}")
-                result = search_experience(query)
-                if result['results_count'] > 0:
-                    print(json.dumps(result, indent=2))
-                else:
-                    print("No results found. Try commands 1-9 or 'quit'")
+                print("No results found. Try commands 1-9 or 'quit'")
 
         except KeyboardInterrupt:
             print("\n\nInterrupted. Type 'quit' to exit.")
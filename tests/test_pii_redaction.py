@@ -5,10 +5,25 @@ Ensures no phone numbers or sensitive information in resume data
 """
 
 import re
-import json
+import mmap
+import os
+import string
 import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Tuple, Dict
+from typing import Iterator, List, Tuple, Dict, Union
+
+_DIGITS = string.digits.encode()
+_NON_DIGIT_BYTES = bytes(c for c in range(256) if c not in _DIGITS)
+
+# Luhn doubling of each ASCII digit with the digits of the product summed, as a translate table
+_LUHN_DOUBLED = bytes.maketrans(_DIGITS, bytes(48 + (2 * d if d < 5 else 2 * d - 9) for d in range(10)))
+_CARD_LENGTHS = frozenset({13, 15, 16, 19})
+
+# SSN area numbers (first 3 digits) that are never issued: 000, 666 and 900-999
+_INVALID_SSN_AREAS = frozenset({b'000', b'666'} | {str(area).encode() for area in range(900, 1000)})
 
 
 class PIIDetector:
@@ -16,16 +31,14 @@ class PIIDetector:
 
     # Phone number patterns
     PHONE_PATTERNS = [
-        # US phone formats
+        # US phone formats (also covers generic 10-digit runs)
         r'(?<!\d)(?:\+?1[\s.-]?)?(?:\(\d{3}\)|\d{3})[\s.-]?\d{3}[\s.-]?\d{4}(?!\d)',
+        # With extensions (kept as its own pass: an extension can run into an adjacent number)
+        r'(?<!\d)(?:\+?1[\s.-]?)?(?:\(\d{3}\)|\d{3})[\s.-]?\d{3}[\s.-]?\d{4}(?:\s*(?:ext|x|extension)[\s.:]*\d{1,5})?(?!\d)',
         # Spaced format
         r'\d\s\d\s\d\s\d\s\d\s\d\s\d\s\d\s\d\s\d',
         # International formats
-        r'\+\d{1,3}[\s.-]?\d{2,4}[\s.-]?\d{3,4}[\s.-]?\d{4}',
-        # Generic 10-digit
-        r'(?<!\d)\d{10}(?!\d)',
-        # With extensions
-        r'(?<!\d)(?:\+?1[\s.-]?)?(?:\(\d{3}\)|\d{3})[\s.-]?\d{3}[\s.-]?\d{4}(?:\s*(?:ext|x|extension)[\s.:]*\d{1,5})?(?!\d)'
+        r'\+\d{1,3}[\s.-]?\d{2,4}[\s.-]?\d{3,4}[\s.-]?\d{4}'
     ]
 
     # SSN patterns (should never be in resume)
@@ -40,65 +53,127 @@ class PIIDetector:
         r'(?<!\d)\d{16}(?!\d)'
     ]
 
+    # Email patterns (allowed for professional use, reported as INFO only)
+    EMAIL_PATTERNS = [
+        r'[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}'
+    ]
+
+    # Files to check, and directories never worth walking into
+    SCAN_EXTENSIONS = frozenset({'.json', '.md', '.py', '.txt'})
+    SKIP_DIRS = frozenset({'node_modules', '__pycache__', '.git'})
+
+    # Smaller trees are checked in-process, where pool startup would dominate
+    PARALLEL_MIN_FILES = 64
+
+    # Files above this size, or with a NUL byte in their head, are reported as skipped
+    MAX_BYTES = 10 * 1024 * 1024
+    BINARY_SNIFF_BYTES = 4096
+
+    # Fewest digits any pattern can match (a bare SSN), counted in slices of this size
+    MIN_PII_DIGITS = 9
+    DIGIT_SCAN_CHUNK = 64 * 1024
+
+    # Patterns run over raw bytes (file contents are memory-mapped), so matches are ASCII.
+    # Every pattern as one alternation, so text without any candidate is rejected in a single pass
+    _ANY_PII_RE = re.compile('|'.join(f'(?:{p})' for p in PHONE_PATTERNS + SSN_PATTERNS + CC_PATTERNS).encode())
+
+    _PHONE_RES = [re.compile(p.encode()) for p in PHONE_PATTERNS]
+    _SSN_RES = [re.compile(p.encode()) for p in SSN_PATTERNS]
+    _CC_RES = [re.compile(p.encode()) for p in CC_PATTERNS]
+    _EMAIL_RES = [re.compile(p.encode()) for p in EMAIL_PATTERNS]
+
     def __init__(self):
         self.issues_found = []
 
-    def check_text(self, text: str, filename: str) -> List[Dict]:
-        """Check text for PII patterns"""
+    def check_text(self, text: Union[str, bytes, mmap.mmap], filename: str) -> List[Dict]:
+        """Check text (str, bytes or a memory map) for PII patterns"""
+        if isinstance(text, str):
+            text = text.encode()
         issues = []
 
-        # Check for phone numbers
-        for pattern in self.PHONE_PATTERNS:
-            matches = re.findall(pattern, text)
-            if matches:
-                # Filter out false positives (like years or percentages)
-                real_phones = [m for m in matches if not self._is_false_positive(m)]
-                if real_phones:
+        # Check for emails (they need no digits, so this runs ahead of the digit gate)
+        if text.find(b'@') != -1:
+            for rx in self._EMAIL_RES:
+                emails = [m.group().decode('ascii') for m in rx.finditer(text)]
+                if emails:
                     issues.append({
-                        "type": "phone_number",
+                        "type": "email",
                         "file": filename,
-                        "pattern": pattern,
-                        "matches": real_phones,
-                        "severity": "HIGH"
+                        "pattern": rx.pattern.decode(),
+                        "matches": emails,
+                        "severity": "INFO"
                     })
 
+        # Counting digits is far cheaper than any regex pass and rules out most files
+        if not self._has_min_digits(text):
+            return issues
+        if not self._ANY_PII_RE.search(text):
+            return issues
+
+        # Check for phone numbers, filtering out false positives (like years or percentages)
+        for rx in self._PHONE_RES:
+            real_phones = [
+                m.group().decode('ascii') for m in rx.finditer(text)
+                if not self._is_false_positive(m.group())
+            ]
+            if real_phones:
+                issues.append({
+                    "type": "phone_number",
+                    "file": filename,
+                    "pattern": rx.pattern.decode(),
+                    "matches": real_phones,
+                    "severity": "HIGH"
+                })
+
         # Check for SSN
-        for pattern in self.SSN_PATTERNS:
-            matches = re.findall(pattern, text)
-            if matches:
-                # Filter out false positives
-                real_ssns = [m for m in matches if self._looks_like_ssn(m)]
-                if real_ssns:
-                    issues.append({
-                        "type": "ssn",
-                        "file": filename,
-                        "pattern": pattern,
-                        "matches": real_ssns,
-                        "severity": "CRITICAL"
-                    })
+        for rx in self._SSN_RES:
+            real_ssns = [
+                m.group().decode('ascii') for m in rx.finditer(text)
+                if self._looks_like_ssn(m.group())
+            ]
+            if real_ssns:
+                issues.append({
+                    "type": "ssn",
+                    "file": filename,
+                    "pattern": rx.pattern.decode(),
+                    "matches": real_ssns,
+                    "severity": "CRITICAL"
+                })
 
         # Check for credit cards
-        for pattern in self.CC_PATTERNS:
-            matches = re.findall(pattern, text)
-            if matches:
-                if any(self._luhn_check(m.replace(" ", "").replace("-", "")) for m in matches):
-                    issues.append({
-                        "type": "credit_card",
-                        "file": filename,
-                        "pattern": pattern,
-                        "matches": matches,
-                        "severity": "CRITICAL"
-                    })
+        for rx in self._CC_RES:
+            cards = [
+                m.group().decode('ascii') for m in rx.finditer(text)
+                if self._luhn_check(m.group().translate(None, b' -'))
+            ]
+            if cards:
+                issues.append({
+                    "type": "credit_card",
+                    "file": filename,
+                    "pattern": rx.pattern.decode(),
+                    "matches": cards,
+                    "severity": "CRITICAL"
+                })
 
         return issues
 
-    def _is_false_positive(self, match: str) -> bool:
+    def _has_min_digits(self, text: Union[bytes, mmap.mmap]) -> bool:
+        """Check whether text holds at least MIN_PII_DIGITS digits, stopping as soon as it does"""
+        digits = 0
+        for start in range(0, len(text), self.DIGIT_SCAN_CHUNK):
+            chunk = text[start:start + self.DIGIT_SCAN_CHUNK]
+            digits += len(chunk) - len(chunk.translate(None, _DIGITS))
+            if digits >= self.MIN_PII_DIGITS:
+                return True
+        return False
+
+    def _is_false_positive(self, match: bytes) -> bool:
         """Check if a phone pattern match is actually something else"""
         # Remove non-digits
-        digits_only = re.sub(r'\D', '', match)
+        digits_only = match if match.isdigit() else match.translate(None, _NON_DIGIT_BYTES)
 
         # Years (1900-2099)
-        if 1900 <= int(digits_only[:4]) <= 2099 and len(digits_only) == 4:
+        if len(digits_only) == 4 and b'1900' <= digits_only <= b'2099':
             return True
 
         # Percentages or metrics (like "92% accuracy")
@@ -106,57 +181,44 @@ class PIIDetector:
             return True
 
         # Version numbers
-        if '.' in match and len(digits_only) <= 6:
+        if b'.' in match and len(digits_only) <= 6:
             return True
 
         return False
 
-    def _looks_like_ssn(self, match: str) -> bool:
+    def _looks_like_ssn(self, match: bytes) -> bool:
         """Check if pattern really looks like SSN"""
-        digits_only = re.sub(r'\D', '', match)
-        if len(digits_only) != 9:
+        digits = match.translate(None, _NON_DIGIT_BYTES)
+        if len(digits) != 9:
             return False
 
-        # SSN rules: first 3 digits not 000, 666, or 900-999
-        first_three = int(digits_only[:3])
-        if first_three == 0 or first_three == 666 or first_three >= 900:
-            return False
-
-        return True
+        return digits[:3] not in _INVALID_SSN_AREAS
 
-    def _luhn_check(self, number: str) -> bool:
+    def _luhn_check(self, number: bytes) -> bool:
         """Luhn algorithm to validate credit card numbers"""
-        try:
-            digits = [int(d) for d in number]
-            checksum = 0
-            for i, digit in enumerate(reversed(digits[:-1])):
-                if i % 2 == 0:
-                    digit *= 2
-                    if digit > 9:
-                        digit -= 9
-                checksum += digit
-            return (checksum + digits[-1]) % 10 == 0
-        except:
+        if not number.isdigit() or len(number) not in _CARD_LENGTHS:
             return False
+        # Every second digit from the right is doubled; slicing and summing bytes keeps the loop in C
+        digits = number[::-1]
+        checksum = sum(digits[::2]) + sum(digits[1::2].translate(_LUHN_DOUBLED)) - 48 * len(digits)
+        return checksum % 10 == 0
 
     def check_file(self, filepath: Path) -> List[Dict]:
         """Check a file for PII"""
         try:
-            if filepath.suffix == '.json':
-                with open(filepath, 'r') as f:
-                    # Check both raw JSON and string values
-                    content = f.read()
-                    issues = self.check_text(content, str(filepath))
-
-                    # Also check parsed JSON values
-                    f.seek(0)
-                    data = json.load(f)
-                    json_text = json.dumps(data, indent=2)
-                    issues.extend(self.check_text(json_text, f"{filepath} (parsed)"))
-
-            else:
-                with open(filepath, 'r') as f:
-                    content = f.read()
+            with open(filepath, 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                # mmap can't map an empty file
+                if not size:
+                    return []
+                if size > self.MAX_BYTES:
+                    return [self._skipped_issue(filepath, f"larger than {self.MAX_BYTES} bytes")]
+                # JSON files need no separate parsed pass: the digits and separators the patterns
+                # match are never escaped by JSON, so PII in string values shows up in the raw bytes
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                    # A NUL byte near the start means a binary file
+                    if content.find(b'\x00', 0, self.BINARY_SNIFF_BYTES) != -1:
+                        return [self._skipped_issue(filepath, "binary content")]
                     issues = self.check_text(content, str(filepath))
 
             return issues
@@ -164,22 +226,64 @@ class PIIDetector:
             print(f"Error checking {filepath}: {e}")
             return []
 
+    def _skipped_issue(self, filepath: Path, reason: str) -> Dict:
+        """Issue for a file that was not scanned, so skipping it never passes silently"""
+        return {
+            "type": "skipped",
+            "file": str(filepath),
+            "pattern": None,
+            "matches": [],
+            "reason": reason,
+            "severity": "HIGH"
+        }
+
     def check_directory(self, directory: Path) -> Tuple[bool, List[Dict]]:
         """Check all relevant files in directory"""
+        files = list(self.iter_files(directory))
         all_issues = []
-
-        # Files to check
-        patterns = ['*.json', '*.md', '*.py', '*.txt']
-        for pattern in patterns:
-            for filepath in directory.rglob(pattern):
-                # Skip test files and node_modules
-                if 'node_modules' in str(filepath) or '__pycache__' in str(filepath):
-                    continue
-
+        if len(files) < self.PARALLEL_MIN_FILES:
+            for filepath in files:
                 issues = self.check_file(filepath)
                 all_issues.extend(issues)
+        else:
+            # Workers get this detector, so per-instance settings such as MAX_BYTES carry over
+            with ProcessPoolExecutor(initializer=_init_worker, initargs=(self,)) as executor:
+                for issues in executor.map(_scan_one, map(str, files), chunksize=16):
+                    all_issues.extend(issues)
+
+        # Informational issues (emails) don't fail the check
+        passed = all(issue["severity"] == "INFO" for issue in all_issues)
+        return passed, all_issues
+
+    def iter_files(self, directory: Path) -> Iterator[Path]:
+        """Yield the files to check under directory in a single walk"""
+        for root, dirnames, filenames in os.walk(directory):
+            # Prune skipped directories so they are never descended into
+            dirnames[:] = [d for d in dirnames if d not in self.SKIP_DIRS]
+            for filename in filenames:
+                if os.path.splitext(filename)[1] in self.SCAN_EXTENSIONS:
+                    yield Path(root, filename)
 
-        return len(all_issues) == 0, all_issues
+
+_DETECTOR = None
+
+
+def _init_worker(detector: PIIDetector) -> None:
+    """Use the parent's configured detector in this process (process pool initializer)"""
+    global _DETECTOR
+    _DETECTOR = detector
+
+
+def _scan_one(path_str: str) -> List[Dict]:
+    """Check one file with this process's detector (process pool worker)"""
+    return _DETECTOR.check_file(Path(path_str))
+
+
+@lru_cache(maxsize=None)
+def _scan_project(root_str: str) -> Tuple[bool, Tuple[Dict, ...]]:
+    """Check a directory once and share the result between tests"""
+    passed, all_issues = PIIDetector().check_directory(Path(root_str))
+    return passed, tuple(all_issues)
 
 
 def test_no_phone_numbers():
@@ -215,10 +319,9 @@ def test_no_phone_numbers():
 
 def test_no_ssn():
     """Test that no SSNs exist in any files"""
-    detector = PIIDetector()
     project_root = Path(__file__).parent.parent
 
-    passed, all_issues = detector.check_directory(project_root)
+    passed, all_issues = _scan_project(str(project_root))
 
     ssn_issues = [i for i in all_issues if i['type'] == 'ssn']
 
@@ -234,10 +337,9 @@ def test_no_ssn():
 
 def test_no_credit_cards():
     """Test that no credit card numbers exist"""
-    detector = PIIDetector()
     project_root = Path(__file__).parent.parent
 
-    passed, all_issues = detector.check_directory(project_root)
+    passed, all_issues = _scan_project(str(project_root))
 
     cc_issues = [i for i in all_issues if i['type'] == 'credit_card']
 
@@ -256,17 +358,98 @@ def test_email_allowed():
     readme = project_root / "README.md"
 
     if readme.exists():
-        with open(readme, 'r') as f:
-            content = f.read()
-
-        # Email pattern
-        email_pattern = r'[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}'
-        matches = re.findall(email_pattern, content)
+        passed, all_issues = _scan_project(str(project_root))
+        matches = [
+            match
+            for issue in all_issues
+            if issue['type'] == 'email' and Path(issue['file']) == readme
+            for match in issue['matches']
+        ]
 
         # Note: We removed email from README, but this test shows emails are OK if present
         print(f"ℹ️  Emails are allowed. Found {len(matches)} email(s)")
 
 
+def test_no_skipped_files():
+    """Test that every project file could be scanned (oversized or binary files are not checked)"""
+    project_root = Path(__file__).parent.parent
+
+    passed, all_issues = _scan_project(str(project_root))
+
+    skipped_issues = [i for i in all_issues if i['type'] == 'skipped']
+
+    if skipped_issues:
+        print("❌ FILES SKIPPED:")
+        for issue in skipped_issues:
+            print(f"  File: {issue['file']} ({issue['reason']})")
+        assert False, f"Skipped {len(skipped_issues)} file(s)"
+
+    print("✅ All files scanned")
+
+
+def test_skipped_files_fail_check():
+    """Test that oversized and binary files are reported as skipped and fail the check"""
+    detector = PIIDetector()
+    detector.MAX_BYTES = 64
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        (root / "large.txt").write_text("x" * (detector.MAX_BYTES + 1))
+        (root / "binary.txt").write_bytes(b"header\x00body")
+        (root / "clean.md").write_text("nothing to report")
+
+        passed, all_issues = detector.check_directory(root)
+
+    skipped = sorted(Path(i['file']).name for i in all_issues if i['type'] == 'skipped')
+    assert skipped == ["binary.txt", "large.txt"], f"Unexpected skipped files: {skipped}"
+    assert not passed, "Skipped files must fail the check"
+
+    print("✅ Oversized and binary files are reported as skipped")
+
+
+def test_email_only_passes():
+    """Test that INFO-level email issues alone do not fail the check"""
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        (root / "README.md").write_text("Contact: jane.doe@example.com\n")
+
+        passed, all_issues = PIIDetector().check_directory(root)
+
+    assert [(i['type'], i['severity']) for i in all_issues] == [("email", "INFO")], f"Unexpected issues: {all_issues}"
+    assert passed, "Emails alone must not fail the check"
+
+    print("✅ Emails are reported as INFO without failing the check")
+
+
+def test_parallel_scan_matches_serial():
+    """Test that the process-pool directory scan reports the same issues, in file order, as the serial scan"""
+    detector = PIIDetector()
+    detector.MAX_BYTES = 64
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        for i in range(detector.PARALLEL_MIN_FILES + 8):
+            text = f"note {i}: call {555}-{123}-{4567 + i}\n" if i % 3 == 0 else f"note {i}: nothing here\n"
+            (root / f"note_{i:03d}.md").write_text(text)
+        (root / "note_large.md").write_text("x" * (detector.MAX_BYTES + 1))
+
+        files = [str(filepath) for filepath in detector.iter_files(root)]
+        assert len(files) >= detector.PARALLEL_MIN_FILES, "Not enough files to use the process pool"
+        parallel_passed, parallel_issues = detector.check_directory(root)
+
+        serial = PIIDetector()
+        serial.MAX_BYTES = detector.MAX_BYTES
+        serial.PARALLEL_MIN_FILES = len(files) + 1
+        serial_passed, serial_issues = serial.check_directory(root)
+
+    assert parallel_issues == serial_issues, "Process pool and serial scans reported different issues"
+    skipped = [Path(issue['file']).name for issue in parallel_issues if issue['type'] == 'skipped']
+    assert skipped == ["note_large.md"], f"Process pool did not apply the detector's MAX_BYTES: {skipped}"
+    assert not parallel_passed and not serial_passed
+    issue_files = [issue['file'] for issue in parallel_issues]
+    assert issue_files == sorted(issue_files, key=files.index), "Issues are not in file order"
+
+    print(f"✅ Process pool and serial scans agree ({len(parallel_issues)} issues in {len(files)} files)")
+
+
 def run_all_tests():
     """Run all PII detection tests"""
     print("🔍 Running PII Detection Tests")
@@ -276,7 +459,11 @@ def run_all_tests():
         ("Phone Numbers", test_no_phone_numbers),
         ("SSN Patterns", test_no_ssn),
         ("Credit Cards", test_no_credit_cards),
-        ("Email Policy", test_email_allowed)
+        ("Email Policy", test_email_allowed),
+        ("Skipped Files", test_no_skipped_files),
+        ("Skip Reporting", test_skipped_files_fail_check),
+        ("Email Severity", test_email_only_passes),
+        ("Parallel Scan", test_parallel_scan_matches_serial)
     ]
 
     failed = []